@@ -4,42 +4,53 @@ Performance Review Generator
 Main script that generates complete performance reviews from CSV files.
 """
 
+import io
 import sys
 import os
-import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
 
 # Import our modules
-from parse_csv import PerformanceReviewParser
-from prompt_templates import PromptTemplates
+from parse_csv import PerformanceReviewParser, dump_json
+from prompt_templates import SECTIONS, PromptTemplates
+
+
+_GENERIC_PHRASES = (
+    "various", "multiple", "several", "many", "numerous",
+    "improved performance", "enhanced quality", "increased efficiency"
+)
+
+
+# Fixed head of the parsed-data summary; category lines are appended
+_SUMMARY_TMPL = """
+{rule}
+📊 PERFORMANCE DATA SUMMARY
+{rule}
+
+👤 Owner: {owner}
+🏢 Team: {team}
+📌 Role: {role}
+
+📈 Total Objectives: {total_objectives}
+📂 By Category:"""
 
 
 class ReviewGenerator:
     """Main class for generating performance reviews."""
     
-    SECTIONS = [
-        (1, "Engineering/Operation Excellence"),
-        (2, "Roadmap Delivery"),
-        (3, "Raising the Bar"),
-        (4, "Mentorship"),
-        (5, "Tech Initiatives"),
-        (6, "Scope & Influence"),
-        (7, "Ambiguity & Problem Complexity"),
-        (8, "Execution"),
-        (9, "Impact"),
-        (10, "Culture & Founder Mentality"),
-        (11, "What are your areas of strength?"),
-        (12, "What are your areas of development?"),
-    ]
+    SECTIONS = SECTIONS
     
     def __init__(self, csv_path: str, role: Optional[str] = None):
         self.csv_path = csv_path
         self.parser = PerformanceReviewParser(csv_path)
         self.data = None
         self.override_role = role
+        self._responses: Optional[Dict[str, Dict[str, Any]]] = None
         
     def generate(self) -> Dict[str, str]:
         """Generate all review sections."""
+        if self._responses is not None:
+            return self._responses
+        
         # Parse the CSV
         print("🔍 Parsing CSV file...")
         self.data = self.parser.parse()
@@ -65,13 +76,12 @@ class ReviewGenerator:
         print("=" * 70)
         
         responses = {}
-        for section_num, section_name in self.SECTIONS:
+        # All section prompts are built in one batch from shared blocks
+        for section_num, section_name, prompt in PromptTemplates.get_all_section_prompts(self.data):
             print(f"\n{'OBJECTIVES' if section_num <= 5 else 'COMPETENCIES' if section_num <= 10 else 'OPEN QUESTIONS'}")
             print(f"Section {section_num}: {section_name}")
             print("-" * 70)
             
-            prompt = PromptTemplates.get_section_prompt(section_num, section_name, self.data)
-            
             # For now, we'll just display prompts and let user use LLM
             # In a real implementation, this could call an LLM API
             responses[section_name] = {
@@ -82,42 +92,23 @@ class ReviewGenerator:
             
             print(f"\n✓ Generated prompt for section {section_num}")
         
+        self._responses = responses
         return responses
     
     def generate_interactive(self) -> str:
         """Generate review interactively with LLM prompts."""
-        responses = self.generate()
-        
-        print("\n" + "=" * 70)
-        print("📋 REVIEW GENERATION PROMPTS")
-        print("=" * 70)
-        print("\nCopy each prompt below to your LLM (Claude, GPT, etc.) to generate responses.")
-        print("Then compile the responses into your final performance review.\n")
-        
-        output = []
-        output.append("# Performance Review Prompts\n")
-        output.append(f"**Generated for:** {self.data['metadata']['owner']}\n")
-        output.append(f"**Role:** {self.data['metadata']['role']}\n")
-        output.append(f"**Team:** {self.data['metadata']['team']}\n")
-        output.append("\n---\n")
-        
-        for section_num, section_name in self.SECTIONS:
-            section_data = responses[section_name]
-            
-            output.append(f"\n## Section {section_num}: {section_name}\n")
-            output.append("```\n")
-            output.append(section_data['prompt'])
-            output.append("\n```\n")
-            output.append("\n---\n")
+        responses = self._generate_with_instructions()
         
-        return '\n'.join(output)
+        buffer = io.StringIO()
+        self._write_prompts(buffer, responses)
+        return buffer.getvalue()
     
     def save_prompts(self, output_path: str):
         """Save all prompts to a file for easy use with LLM."""
-        content = self.generate_interactive()
+        responses = self._generate_with_instructions()
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            self._write_prompts(f, responses)
         
         print(f"\n💾 Saved prompts to: {output_path}")
         print("\n📋 Next steps:")
@@ -126,28 +117,58 @@ class ReviewGenerator:
         print("3. Collect the generated responses")
         print("4. Compile into your final performance review document")
     
-    def _display_summary(self):
-        """Display a summary of parsed data."""
+    def _generate_with_instructions(self) -> Dict[str, Dict[str, Any]]:
+        """Generate all sections and print how to use the prompts."""
+        responses = self.generate()
+        
         print("\n" + "=" * 70)
-        print("📊 PERFORMANCE DATA SUMMARY")
+        print("📋 REVIEW GENERATION PROMPTS")
         print("=" * 70)
+        print("\nCopy each prompt below to your LLM (Claude, GPT, etc.) to generate responses.")
+        print("Then compile the responses into your final performance review.\n")
         
-        print(f"\n👤 Owner: {self.data['metadata']['owner']}")
-        print(f"🏢 Team: {self.data['metadata']['team']}")
-        print(f"📌 Role: {self.data['metadata']['role']}")
+        return responses
+    
+    def _write_prompts(self, out: TextIO, responses: Dict[str, Dict[str, Any]]):
+        """Write the prompts document segment by segment to a text stream."""
+        out.write("# Performance Review Prompts\n\n")
+        out.write(f"**Generated for:** {self.data['metadata']['owner']}\n\n")
+        out.write(f"**Role:** {self.data['metadata']['role']}\n\n")
+        out.write(f"**Team:** {self.data['metadata']['team']}\n\n")
+        out.write("\n---\n")
         
-        print(f"\n📈 Total Objectives: {self.data['summary']['total_objectives']}")
-        print("📂 By Category:")
-        for category, count in self.data['summary']['category_counts'].items():
-            print(f"   • {category}: {count}")
+        for section_num, section_name in self.SECTIONS:
+            section_data = responses[section_name]
+            
+            out.write(f"\n\n## Section {section_num}: {section_name}\n\n")
+            out.write("```\n\n")
+            out.write(section_data['prompt'])
+            out.write("\n\n```\n\n")
+            out.write("\n---\n")
+    
+    def _display_summary(self):
+        """Display a summary of parsed data."""
+        lines = [_SUMMARY_TMPL.format_map({
+            'rule': "=" * 70,
+            'owner': self.data['metadata']['owner'],
+            'team': self.data['metadata']['team'],
+            'role': self.data['metadata']['role'],
+            'total_objectives': self.data['summary']['total_objectives'],
+        })]
+        lines.extend(
+            f"   • {category}: {count}"
+            for category, count in self.data['summary']['category_counts'].items()
+        )
         
-        print(f"\n🔢 Metrics Found: {self.data['summary']['metrics_count']}")
-        print(f"🔧 Technologies: {self.data['summary']['technologies_count']}")
+        lines.append(f"\n🔢 Metrics Found: {self.data['summary']['metrics_count']}")
+        lines.append(f"🔧 Technologies: {self.data['summary']['technologies_count']}")
         
         if self.data['technologies']:
-            print(f"   {', '.join(list(self.data['technologies'])[:8])}")
+            lines.append(f"   {', '.join(list(self.data['technologies'])[:8])}")
             if len(self.data['technologies']) > 8:
-                print(f"   ... and {len(self.data['technologies']) - 8} more")
+                lines.append(f"   ... and {len(self.data['technologies']) - 8} more")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
 class ReviewValidator:
@@ -177,22 +198,15 @@ class ReviewValidator:
         
         # Check for metrics if available
         if data['metrics'] and section_name in ['Engineering/Operation Excellence', 'Tech Initiatives', 'Impact']:
-            has_metric = False
-            for metric in data['metrics'][:10]:
-                if metric['text'] in response:
-                    has_metric = True
-                    break
+            has_metric = any(metric['text'] in response for metric in data['metrics'][:10])
             
             if not has_metric:
                 issues.append("Consider including specific metrics to strengthen the response.")
         
         # Check for generic phrases
-        generic_phrases = [
-            "various", "multiple", "several", "many", "numerous",
-            "improved performance", "enhanced quality", "increased efficiency"
-        ]
-        
-        generic_found = [phrase for phrase in generic_phrases if phrase.lower() in response.lower()]
+        # Phrases are lowercase; lowercase the response once for all of them
+        response_lower = response.lower()
+        generic_found = [phrase for phrase in _GENERIC_PHRASES if phrase in response_lower]
         if len(generic_found) > 3:
             issues.append(f"Response contains generic phrases: {', '.join(generic_found)}. Be more specific.")
         
@@ -257,8 +271,7 @@ Examples:
         
         # Save JSON if requested
         if args.json:
-            with open(args.json, 'w') as f:
-                json.dump(generator.data, f, indent=2)
+            dump_json(generator.data, args.json)
             print(f"\n💾 Saved parsed data to: {args.json}")
         
         print("\n✅ Generation complete!")
@@ -6,9 +6,108 @@ Extracts objectives, metrics, role, and team information from objectives CSV fil
 
 import csv
 import re
+import sys
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib encoder is used without it
+    orjson = None
+
+
+# Role titles, fused into one alternation; the leftmost mention wins
+_ROLE_RE = re.compile(
+    r'\b(?:sd[1-3]|sde\s*[1-3]|staff\s+engineer|senior\s+engineer'
+    r'|lead\s+engineer|principal\s+engineer)\b',
+    re.IGNORECASE
+)
+
+_METRIC_PATTERNS = (
+    # Percentage improvements: "99.4% to 99.73%"
+    r'(\d+\.?\d*)\s*%\s+to\s+(\d+\.?\d*)\s*%',
+    # Time improvements: "10s to 250ms", "35 to 41 hr/week"
+    r'(\d+)\s*(s|ms|hr|hrs|hours|minutes|mins)\s+to\s+(\d+)\s*(s|ms|hr|hrs|hours|minutes|mins)',
+    # Count improvements: "Rs 3600 to Rs 4300"
+    r'Rs\s+(\d+)\s+to\s+Rs\s+(\d+)',
+    # Version upgrades: "0.73.8 to 0.78.2"
+    r'(\d+\.\d+\.\d+)\s+to\s+(\d+\.\d+\.\d+)',
+    # Simple counts: "150+ events", "48 dependencies"
+    r'(\d+)\+?\s+(events|dependencies|items|files|repositories|repos)',
+    # Performance multipliers: "~20× faster"
+    r'~?(\d+)×\s+(faster|slower|more|less)',
+    # Percentage changes: "~11.76%", "18.38%"
+    r'~?(\d+\.?\d*)\s*%',
+    # Percentage reduction: "10% through", "reduced by 10%"
+    r'(?:by|reduced)\s+(\d+)\s*%',
+)
+
+# Compiled once at import; each pattern keeps its own finditer pass so
+# overlapping metrics ("99.4% to 99.73%" and "99.73%") are all extracted
+_METRIC_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _METRIC_PATTERNS)
+
+# Every metric pattern needs a digit, so titles without one can be skipped
+_HAS_DIGIT = re.compile(r'\d').search
+
+
+_TECH_KEYWORDS = (
+    'React Native', 'MMKV', 'Databricks', 'Mixpanel', 'AsyncStorage',
+    'Fabric', 'TurboModules', 'Protobufs', 'Crashlytics', 'SDK',
+    'DigiLocker', 'Acko', 'ZeptoLocker', 'AETHER', 'Horizon',
+    'CleverTap', 'AppsFlyer', 'KNOW SDK', 'HyperVerge', 'Lucid',
+    'ClickHouse', 'Kafka', 'LogChef', 'Storybook', 'Fresco',
+    'pdfplumber', 'native-stack', 'KeyboardController',
+    'PagerView', 'Android', 'iOS', 'TypeScript', 'JavaScript',
+    'Python', 'Node.js', 'API', 'JWT', 'OAuth',
+)
+
+# Lowercased once so detection is plain substring search on lowercased text
+_TECH_LOWER = tuple((tech.lower(), tech) for tech in _TECH_KEYWORDS)
+
+# Fixed head of print_summary; the variable-length sections are appended
+_SUMMARY_TMPL = """\
+{rule}
+PERFORMANCE REVIEW DATA SUMMARY
+{rule}
+
+📋 METADATA:
+  Owner: {owner}
+  Team: {team}
+  Role: {role}
+
+📊 OBJECTIVES BY CATEGORY:"""
+
+# Rows read and extracted per batch, bounding the memory held for raw rows
+_CHUNK_SIZE = 50_000
+
+
+def _find_metrics(titles: List[str]) -> List[Dict[str, Any]]:
+    """Extract quantitative metrics from objective titles."""
+    metrics = []
+    for title in titles:
+        if not _HAS_DIGIT(title):
+            continue
+        short_context = title[:80]
+        for metric_re in _METRIC_RES:
+            for match in metric_re.finditer(title):
+                metrics.append({
+                    'text': match.group(0),
+                    'full_context': title,
+                    'short_context': short_context,
+                    'groups': match.groups()
+                })
+    return metrics
+
+
+def _find_technologies(titles: List[str]) -> Set[str]:
+    """Extract technologies and tools mentioned in objective titles."""
+    # Empty titles would only add separators for the tech scan to walk over
+    text = ' '.join(title for title in titles if title).lower()
+    
+    # Case-insensitive search but preserve original case
+    return {tech for lower, tech in _TECH_LOWER if lower in text}
 
 
 class PerformanceReviewParser:
@@ -16,40 +115,96 @@ class PerformanceReviewParser:
     
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
-        self.raw_data = []
+        self._row_count = 0
+        self._titles = []
+        self._parents = []
+        self._states = []
+        self._start_dates = []
+        self._due_dates = []
+        self._progress = []
+        self._statuses = []
         self.objectives = defaultdict(list)
         self.metadata = {}
         self.metrics = []
         self.technologies = set()
+        self._parsed = None
         
     def parse(self) -> Dict[str, Any]:
         """Parse the CSV file and return structured data."""
+        if self._parsed is not None:
+            return self._parsed
+        
         self._read_csv()
-        self._extract_metadata()
-        self._group_objectives()
-        self._extract_metrics()
-        self._extract_technologies()
         
-        return {
+        self._parsed = {
             'metadata': self.metadata,
             'objectives': dict(self.objectives),
             'metrics': self.metrics,
             'technologies': sorted(list(self.technologies)),
             'summary': self._generate_summary()
         }
+        return self._parsed
     
     def _read_csv(self):
-        """Read the CSV file into memory."""
-        with open(self.csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            self.raw_data = list(reader)
+        """Stream the CSV file in chunks, extracting from each as it is read."""
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            # Header name -> column index, resolved once for every chunk
+            indices = {name: index for index, name in enumerate(header)}
+            
+            while True:
+                batch = list(islice(reader, _CHUNK_SIZE))
+                if not batch:
+                    break
+                # Blank lines come back as [], which DictReader used to skip
+                rows = [row for row in batch if row]
+                if rows:
+                    self._process_chunk(header, indices, rows)
+        
+        # Only the extracted results are kept; drop the last chunk's columns
+        self._release_columns()
     
-    def _extract_metadata(self):
-        """Extract role, team, and owner information."""
-        if not self.raw_data:
-            return
+    def _process_chunk(self, header: List[str], indices: Dict[str, int],
+                       rows: List[List[str]]):
+        """Pull the needed columns out of one chunk and run the extractors on it."""
+        first_chunk = not self._row_count
+        self._row_count += len(rows)
         
-        first_row = self.raw_data[0]
+        # Only the columns the extractors use are built, as parallel lists
+        self._titles = self._column(rows, indices.get('Title'))
+        self._parents = self._column(rows, indices.get('Parent Objective Title'))
+        self._states = self._column(rows, indices.get('State'))
+        self._start_dates = self._column(rows, indices.get('Start Date'))
+        self._due_dates = self._column(rows, indices.get('Due Date'))
+        self._progress = self._column(rows, indices.get('Progress %'), '0')
+        self._statuses = self._column(rows, indices.get('Status'))
+        
+        if first_chunk:
+            self._extract_metadata(dict(zip(header, rows[0])))
+        self._group_objectives()
+        self._extract_from_titles()
+    
+    def _release_columns(self):
+        """Drop the per-chunk column lists once extraction is done."""
+        self._titles = []
+        self._parents = []
+        self._states = []
+        self._start_dates = []
+        self._due_dates = []
+        self._progress = []
+        self._statuses = []
+    
+    @staticmethod
+    def _column(rows: List[List[str]], index: Optional[int],
+                default: str = '') -> List[str]:
+        """Return one column of a chunk; absent columns and short rows give ''."""
+        if index is None:
+            return [default] * len(rows)
+        return [row[index] if index < len(row) else '' for row in rows]
+    
+    def _extract_metadata(self, first_row: Dict[str, str]):
+        """Extract role, team, and owner information from the first row."""
         self.metadata = {
             'owner': first_row.get('Owner', '').strip(),
             'owner_email': first_row.get('Owner Email', '').strip(),
@@ -59,92 +214,44 @@ class PerformanceReviewParser:
     
     def _infer_role(self, row: Dict[str, str]) -> str:
         """Try to infer role from available data."""
-        # Check in owner name or email
-        text = f"{row.get('Owner', '')} {row.get('Title', '')}".lower()
-        
-        role_patterns = [
-            r'\bsd[1-3]\b',
-            r'\bsde\s*[1-3]\b',
-            r'\bstaff\s+engineer\b',
-            r'\bsenior\s+engineer\b',
-            r'\blead\s+engineer\b',
-            r'\bprincipal\s+engineer\b'
-        ]
-        
-        for pattern in role_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0).upper()
-        
-        return "UNKNOWN"
+        # Check in owner name or title
+        owner = row.get('Owner', '')
+        title = row.get('Title', '')
+        if not owner and not title:
+            return "UNKNOWN"
+        
+        match = _ROLE_RE.search(f"{owner} {title}")
+        return match.group(0).upper() if match else "UNKNOWN"
     
     def _group_objectives(self):
         """Group objectives by parent category."""
-        for row in self.raw_data:
-            parent = row.get('Parent Objective Title', '').strip()
-            title = row.get('Title', '').strip()
+        rows = zip(
+            self._titles,
+            self._parents,
+            self._states,
+            self._start_dates,
+            self._due_dates,
+            self._progress,
+            self._statuses,
+        )
+        for title, parent, state, start_date, due_date, progress, status in rows:
+            parent = parent.strip()
+            title = title.strip()
             
             if title and parent:
                 self.objectives[parent].append({
                     'title': title,
-                    'state': row.get('State', ''),
-                    'start_date': row.get('Start Date', ''),
-                    'due_date': row.get('Due Date', ''),
-                    'progress': row.get('Progress %', '0'),
-                    'status': row.get('Status', '')
+                    'state': state,
+                    'start_date': start_date,
+                    'due_date': due_date,
+                    'progress': progress,
+                    'status': status
                 })
     
-    def _extract_metrics(self):
-        """Extract quantitative metrics from objective titles."""
-        metric_patterns = [
-            # Percentage improvements: "99.4% to 99.73%"
-            r'(\d+\.?\d*)\s*%\s+to\s+(\d+\.?\d*)\s*%',
-            # Time improvements: "10s to 250ms", "35 to 41 hr/week"
-            r'(\d+)\s*(s|ms|hr|hrs|hours|minutes|mins)\s+to\s+(\d+)\s*(s|ms|hr|hrs|hours|minutes|mins)',
-            # Count improvements: "Rs 3600 to Rs 4300"
-            r'Rs\s+(\d+)\s+to\s+Rs\s+(\d+)',
-            # Version upgrades: "0.73.8 to 0.78.2"
-            r'(\d+\.\d+\.\d+)\s+to\s+(\d+\.\d+\.\d+)',
-            # Simple counts: "150+ events", "48 dependencies"
-            r'(\d+)\+?\s+(events|dependencies|items|files|repositories|repos)',
-            # Performance multipliers: "~20× faster"
-            r'~?(\d+)×\s+(faster|slower|more|less)',
-            # Percentage changes: "~11.76%", "18.38%"
-            r'~?(\d+\.?\d*)\s*%',
-            # Percentage reduction: "10% through", "reduced by 10%"
-            r'(?:by|reduced)\s+(\d+)\s*%',
-        ]
-        
-        for row in self.raw_data:
-            title = row.get('Title', '')
-            for pattern in metric_patterns:
-                matches = re.finditer(pattern, title, re.IGNORECASE)
-                for match in matches:
-                    self.metrics.append({
-                        'text': match.group(0),
-                        'full_context': title,
-                        'groups': match.groups()
-                    })
-    
-    def _extract_technologies(self):
-        """Extract technologies and tools mentioned in objectives."""
-        tech_keywords = [
-            'React Native', 'MMKV', 'Databricks', 'Mixpanel', 'AsyncStorage',
-            'Fabric', 'TurboModules', 'Protobufs', 'Crashlytics', 'SDK',
-            'DigiLocker', 'Acko', 'ZeptoLocker', 'AETHER', 'Horizon',
-            'CleverTap', 'AppsFlyer', 'KNOW SDK', 'HyperVerge', 'Lucid',
-            'ClickHouse', 'Kafka', 'LogChef', 'Storybook', 'Fresco',
-            'pdfplumber', 'native-stack', 'KeyboardController',
-            'PagerView', 'Android', 'iOS', 'TypeScript', 'JavaScript',
-            'Python', 'Node.js', 'API', 'JWT', 'OAuth'
-        ]
-        
-        all_text = ' '.join(row.get('Title', '') for row in self.raw_data)
-        
-        for tech in tech_keywords:
-            # Case-insensitive search but preserve original case
-            if re.search(re.escape(tech), all_text, re.IGNORECASE):
-                self.technologies.add(tech)
+    def _extract_from_titles(self):
+        """Extract metrics and technologies from the chunk's titles."""
+        self.metrics.extend(_find_metrics(self._titles))
+        self.technologies |= _find_technologies(self._titles)
     
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate a summary of the parsed data."""
@@ -160,42 +267,56 @@ class PerformanceReviewParser:
     
     def print_summary(self):
         """Print a human-readable summary of parsed data."""
-        data = self.parse() if not self.objectives else {
-            'metadata': self.metadata,
-            'objectives': self.objectives,
-            'summary': self._generate_summary()
-        }
-        
-        print("=" * 60)
-        print("PERFORMANCE REVIEW DATA SUMMARY")
-        print("=" * 60)
+        data = self.parse()
         
-        print("\n📋 METADATA:")
-        print(f"  Owner: {data['metadata']['owner']}")
-        print(f"  Team: {data['metadata']['team']}")
-        print(f"  Role: {data['metadata']['role']}")
+        lines = [_SUMMARY_TMPL.format_map({
+            'rule': "=" * 60,
+            'owner': data['metadata']['owner'],
+            'team': data['metadata']['team'],
+            'role': data['metadata']['role'],
+        })]
+        lines.extend(
+            f"  • {category}: {count} items"
+            for category, count in data['summary']['category_counts'].items()
+        )
         
-        print("\n📊 OBJECTIVES BY CATEGORY:")
-        for category, count in data['summary']['category_counts'].items():
-            print(f"  • {category}: {count} items")
-        
-        print(f"\n📈 METRICS EXTRACTED: {data['summary']['metrics_count']}")
+        lines.append(f"\n📈 METRICS EXTRACTED: {data['summary']['metrics_count']}")
         if self.metrics[:5]:
-            print("  Examples:")
-            for metric in self.metrics[:5]:
-                print(f"    - {metric['text']}")
+            lines.append("  Examples:")
+            lines.extend(f"    - {metric['text']}" for metric in self.metrics[:5])
         
-        print(f"\n🔧 TECHNOLOGIES IDENTIFIED: {data['summary']['technologies_count']}")
+        lines.append(f"\n🔧 TECHNOLOGIES IDENTIFIED: {data['summary']['technologies_count']}")
         if self.technologies:
-            print(f"  {', '.join(sorted(list(self.technologies))[:10])}")
+            lines.append(f"  {', '.join(sorted(list(self.technologies))[:10])}")
+        
+        lines.append("\n" + "=" * 60)
         
-        print("\n" + "=" * 60)
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# JSON I/O shared by all four CLIs. It lives here next to the optional orjson
+# import, so validate_review and prompt_templates import parse_csv for it.
+def load_json(path: str) -> Any:
+    """Read JSON from path, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str):
+    """Write data to path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
 
 
 def main():
     """Main entry point for the parser."""
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python parse_csv.py <csv_file_path>")
         print("\nExample:")
@@ -215,8 +336,7 @@ def main():
         # Optionally save to JSON
         if len(sys.argv) > 2 and sys.argv[2] == '--json':
             output_path = csv_path.replace('.csv', '_parsed.json')
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_json(data, output_path)
             print(f"\n💾 Saved parsed data to: {output_path}")
         
     except FileNotFoundError:
@@ -4,45 +4,113 @@ Prompt Templates for Performance Review Generator
 Contains detailed prompts for generating each of the 12 review sections.
 """
 
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
+
+
+# The 12 review sections: 5 Objectives, 5 Competencies, 2 Open Questions
+SECTIONS = [
+    (1, "Engineering/Operation Excellence"),
+    (2, "Roadmap Delivery"),
+    (3, "Raising the Bar"),
+    (4, "Mentorship"),
+    (5, "Tech Initiatives"),
+    (6, "Scope & Influence"),
+    (7, "Ambiguity & Problem Complexity"),
+    (8, "Execution"),
+    (9, "Impact"),
+    (10, "Culture & Founder Mentality"),
+    (11, "What are your areas of strength?"),
+    (12, "What are your areas of development?"),
+]
+
+
+class PromptContext:
+    """Per-review prompt inputs; each shared text block is formatted on first use."""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.role = data['metadata']['role']
+        self.team = data['metadata']['team']
+        self._all_objectives: Optional[str] = None
+        self._metrics: Optional[str] = None
+        self._technologies: Optional[str] = None
+        self._objectives_by_category: Dict[str, str] = {}
+    
+    @property
+    def all_objectives(self) -> str:
+        """Every objective, grouped by category."""
+        if self._all_objectives is None:
+            self._all_objectives = PromptTemplates._format_all_objectives(self.data['objectives'])
+        return self._all_objectives
+    
+    @property
+    def metrics(self) -> str:
+        """Deduplicated metrics list."""
+        if self._metrics is None:
+            self._metrics = PromptTemplates._format_metrics(self.data['metrics'])
+        return self._metrics
+    
+    @property
+    def technologies(self) -> str:
+        """Comma-separated technologies."""
+        if self._technologies is None:
+            self._technologies = ', '.join(self.data['technologies'])
+        return self._technologies
+    
+    def objectives(self, category: str) -> str:
+        """Formatted objectives of one category."""
+        formatted = self._objectives_by_category.get(category)
+        if formatted is None:
+            formatted = PromptTemplates._format_objectives(
+                self.data['objectives'].get(category, [])
+            )
+            self._objectives_by_category[category] = formatted
+        return formatted
 
 
 class PromptTemplates:
     """Manages prompt templates for generating performance review sections."""
     
     @staticmethod
-    def get_section_prompt(section_number: int, section_name: str, data: Dict[str, Any]) -> str:
-        """Get the prompt for a specific section."""
+    def get_section_prompt(section_number: int, section_name: str,
+                           data: Union[Dict[str, Any], PromptContext]) -> str:
+        """Get the prompt for a specific section.
         
-        prompts = {
-            1: PromptTemplates._engineering_excellence_prompt,
-            2: PromptTemplates._roadmap_delivery_prompt,
-            3: PromptTemplates._raising_bar_prompt,
-            4: PromptTemplates._mentorship_prompt,
-            5: PromptTemplates._tech_initiatives_prompt,
-            6: PromptTemplates._scope_influence_prompt,
-            7: PromptTemplates._ambiguity_complexity_prompt,
-            8: PromptTemplates._execution_prompt,
-            9: PromptTemplates._impact_prompt,
-            10: PromptTemplates._culture_mentality_prompt,
-            11: PromptTemplates._strengths_prompt,
-            12: PromptTemplates._development_areas_prompt,
-        }
+        Pass a PromptContext when building several sections for the same review
+        so the shared objective/metric blocks are formatted only once.
+        """
         
-        prompt_func = prompts.get(section_number)
-        if not prompt_func:
+        # Explicit bounds check: 0 or negative numbers must not index from the end
+        if not 1 <= section_number <= len(_SECTION_PROMPTS):
             raise ValueError(f"Invalid section number: {section_number}")
+        prompt_func = _SECTION_PROMPTS[section_number - 1]
+        
+        ctx = data if isinstance(data, PromptContext) else PromptContext(data)
+        return prompt_func(ctx)
+    
+    @staticmethod
+    def get_all_section_prompts(
+            data: Union[Dict[str, Any], PromptContext]) -> List[Tuple[int, str, str]]:
+        """Build the prompts for all sections in one batch.
         
-        return prompt_func(data)
+        Returns (section_number, section_name, prompt) tuples in section order,
+        all rendered from a single shared PromptContext.
+        """
+        ctx = data if isinstance(data, PromptContext) else PromptContext(data)
+        return [
+            (section_number, section_name,
+             PromptTemplates.get_section_prompt(section_number, section_name, ctx))
+            for section_number, section_name in SECTIONS
+        ]
     
     @staticmethod
-    def _engineering_excellence_prompt(data: Dict[str, Any]) -> str:
+    def _engineering_excellence_prompt(ctx: PromptContext) -> str:
         """Prompt for Engineering/Operation Excellence section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        objectives = data['objectives'].get('Engineering/Operation Excellence', [])
-        metrics = data['metrics']
-        technologies = data['technologies']
+        role = ctx.role
+        team = ctx.team
+        objectives = ctx.objectives('Engineering/Operation Excellence')
+        metrics = ctx.metrics
+        technologies = ctx.technologies
         
         return f"""Generate a response for the "Engineering/Operation Excellence" section of a performance review.
 
@@ -51,13 +119,13 @@ CONTEXT:
 - Team: {team}
 
 ENGINEERING/OPERATION EXCELLENCE OBJECTIVES:
-{PromptTemplates._format_objectives(objectives)}
+{objectives}
 
 ALL METRICS EXTRACTED:
-{PromptTemplates._format_metrics(metrics)}
+{metrics}
 
 TECHNOLOGIES USED:
-{', '.join(technologies)}
+{technologies}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -78,11 +146,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _roadmap_delivery_prompt(data: Dict[str, Any]) -> str:
+    def _roadmap_delivery_prompt(ctx: PromptContext) -> str:
         """Prompt for Roadmap Delivery section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        objectives = data['objectives'].get('Roadmap Delivery', [])
+        role = ctx.role
+        team = ctx.team
+        objectives = ctx.objectives('Roadmap Delivery')
         
         return f"""Generate a response for the "Roadmap Delivery" section of a performance review.
 
@@ -91,7 +159,7 @@ CONTEXT:
 - Team: {team}
 
 ROADMAP DELIVERY OBJECTIVES:
-{PromptTemplates._format_objectives(objectives)}
+{objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -112,11 +180,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _raising_bar_prompt(data: Dict[str, Any]) -> str:
+    def _raising_bar_prompt(ctx: PromptContext) -> str:
         """Prompt for Raising the Bar section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        objectives = data['objectives'].get('Raising the Bar', [])
+        role = ctx.role
+        team = ctx.team
+        objectives = ctx.objectives('Raising the Bar')
         
         return f"""Generate a response for the "Raising the Bar" section of a performance review.
 
@@ -125,7 +193,7 @@ CONTEXT:
 - Team: {team}
 
 RAISING THE BAR OBJECTIVES:
-{PromptTemplates._format_objectives(objectives)}
+{objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -144,11 +212,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _mentorship_prompt(data: Dict[str, Any]) -> str:
+    def _mentorship_prompt(ctx: PromptContext) -> str:
         """Prompt for Mentorship section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        objectives = data['objectives'].get('Mentorship', [])
+        role = ctx.role
+        team = ctx.team
+        objectives = ctx.objectives('Mentorship')
         
         return f"""Generate a response for the "Mentorship" section of a performance review.
 
@@ -157,7 +225,7 @@ CONTEXT:
 - Team: {team}
 
 MENTORSHIP OBJECTIVES:
-{PromptTemplates._format_objectives(objectives)}
+{objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -176,13 +244,13 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _tech_initiatives_prompt(data: Dict[str, Any]) -> str:
+    def _tech_initiatives_prompt(ctx: PromptContext) -> str:
         """Prompt for Tech Initiatives section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        objectives = data['objectives'].get('Tech Initiatives', [])
-        metrics = data['metrics']
-        technologies = data['technologies']
+        role = ctx.role
+        team = ctx.team
+        objectives = ctx.objectives('Tech Initiatives')
+        metrics = ctx.metrics
+        technologies = ctx.technologies
         
         return f"""Generate a response for the "Tech Initiatives" section of a performance review.
 
@@ -191,13 +259,13 @@ CONTEXT:
 - Team: {team}
 
 TECH INITIATIVES OBJECTIVES:
-{PromptTemplates._format_objectives(objectives)}
+{objectives}
 
 KEY METRICS:
-{PromptTemplates._format_metrics(metrics)}
+{metrics}
 
 TECHNOLOGIES:
-{', '.join(technologies)}
+{technologies}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -217,11 +285,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _scope_influence_prompt(data: Dict[str, Any]) -> str:
+    def _scope_influence_prompt(ctx: PromptContext) -> str:
         """Prompt for Scope & Influence section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
         
         return f"""Generate a response for the "Scope & Influence" competency section.
 
@@ -230,7 +298,7 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES (synthesize cross-cutting themes):
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -251,12 +319,12 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _ambiguity_complexity_prompt(data: Dict[str, Any]) -> str:
+    def _ambiguity_complexity_prompt(ctx: PromptContext) -> str:
         """Prompt for Ambiguity & Problem Complexity section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
-        metrics = data['metrics']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
+        metrics = ctx.metrics
         
         return f"""Generate a response for the "Ambiguity & Problem Complexity" competency section.
 
@@ -265,10 +333,10 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES:
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 KEY METRICS:
-{PromptTemplates._format_metrics(metrics)}
+{metrics}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -290,11 +358,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _execution_prompt(data: Dict[str, Any]) -> str:
+    def _execution_prompt(ctx: PromptContext) -> str:
         """Prompt for Execution competency section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
         
         return f"""Generate a response for the "Execution" competency section.
 
@@ -303,7 +371,7 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES:
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -325,12 +393,12 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _impact_prompt(data: Dict[str, Any]) -> str:
+    def _impact_prompt(ctx: PromptContext) -> str:
         """Prompt for Impact competency section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
-        metrics = data['metrics']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
+        metrics = ctx.metrics
         
         return f"""Generate a response for the "Impact" competency section.
 
@@ -339,10 +407,10 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES:
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 KEY METRICS (prioritize business and user impact):
-{PromptTemplates._format_metrics(metrics)}
+{metrics}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -364,11 +432,11 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _culture_mentality_prompt(data: Dict[str, Any]) -> str:
+    def _culture_mentality_prompt(ctx: PromptContext) -> str:
         """Prompt for Culture & Founder Mentality section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
         
         return f"""Generate a response for the "Culture & Founder Mentality" competency section.
 
@@ -377,7 +445,7 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES:
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -399,13 +467,13 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _strengths_prompt(data: Dict[str, Any]) -> str:
+    def _strengths_prompt(ctx: PromptContext) -> str:
         """Prompt for Areas of Strength section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        all_objectives = data['objectives']
-        metrics = data['metrics']
-        technologies = data['technologies']
+        role = ctx.role
+        team = ctx.team
+        all_objectives = ctx.all_objectives
+        metrics = ctx.metrics
+        technologies = ctx.technologies
         
         return f"""Generate a response for the "What are your areas of strength?" open question.
 
@@ -414,13 +482,13 @@ CONTEXT:
 - Team: {team}
 
 ALL OBJECTIVES:
-{PromptTemplates._format_all_objectives(all_objectives)}
+{all_objectives}
 
 KEY METRICS:
-{PromptTemplates._format_metrics(metrics)}
+{metrics}
 
 TECHNOLOGIES:
-{', '.join(technologies)}
+{technologies}
 
 REQUIREMENTS:
 1. Start with: "As an {role} in the {team} Team..."
@@ -442,12 +510,10 @@ STYLE:
 Generate the response now:"""
 
     @staticmethod
-    def _development_areas_prompt(data: Dict[str, Any]) -> str:
+    def _development_areas_prompt(ctx: PromptContext) -> str:
         """Prompt for Areas of Development section."""
-        role = data['metadata']['role']
-        team = data['metadata']['team']
-        
-        role_level = role.upper()
+        role = ctx.role
+        team = ctx.team
         
         return f"""Generate a response for the "What are your areas of development?" open question.
 
@@ -523,24 +589,45 @@ Generate the response now:"""
         seen = set()
         for metric in metrics:
             text = metric['text']
-            if text not in seen:
-                formatted.append(f"- {text} (from: {metric['full_context'][:80]}...)")
-                seen.add(text)
+            if text in seen:
+                continue
+            seen.add(text)
+            # short_context is precomputed by the parser; older JSON lacks it
+            short_context = metric.get('short_context') or metric['full_context'][:80]
+            formatted.append(f"- {text} (from: {short_context}...)")
+            if len(formatted) == 15:  # Limit to 15 metrics
+                break
         
-        return '\n'.join(formatted[:15])  # Limit to 15 metrics
+        return '\n'.join(formatted)
+
+
+# Section builders indexed by section number - 1, built once at import
+_SECTION_PROMPTS: Tuple[Callable[[PromptContext], str], ...] = (
+    PromptTemplates._engineering_excellence_prompt,
+    PromptTemplates._roadmap_delivery_prompt,
+    PromptTemplates._raising_bar_prompt,
+    PromptTemplates._mentorship_prompt,
+    PromptTemplates._tech_initiatives_prompt,
+    PromptTemplates._scope_influence_prompt,
+    PromptTemplates._ambiguity_complexity_prompt,
+    PromptTemplates._execution_prompt,
+    PromptTemplates._impact_prompt,
+    PromptTemplates._culture_mentality_prompt,
+    PromptTemplates._strengths_prompt,
+    PromptTemplates._development_areas_prompt,
+)
 
 
 def main():
     """Test the prompt templates."""
-    import json
     import sys
+    from parse_csv import load_json
     
     if len(sys.argv) < 2:
         print("Usage: python prompt_templates.py <parsed_data.json> [section_number]")
         sys.exit(1)
     
-    with open(sys.argv[1], 'r') as f:
-        data = json.load(f)
+    data = load_json(sys.argv[1])
     
     section = int(sys.argv[2]) if len(sys.argv) > 2 else 1
     
@@ -4,11 +4,60 @@ Review Validator
 Validates generated performance review responses for quality and accuracy.
 """
 
-import json
 import sys
 import re
+from collections import Counter
 from typing import Dict, List, Any, Tuple
 
+from parse_csv import dump_json, load_json
+
+
+# Sections where specific numbers are expected
+_METRIC_SECTIONS = frozenset({
+    'Engineering/Operation Excellence',
+    'Tech Initiatives',
+    'Impact',
+    'Ambiguity & Problem Complexity'
+})
+
+# Sections where concrete tools/frameworks are expected
+_TECH_SECTIONS = frozenset({'Tech Initiatives', 'Engineering/Operation Excellence', 'Roadmap Delivery'})
+
+# (lowercase phrase, suggestion) pairs checked against the lowercased response
+_GENERIC_PHRASES: Tuple[Tuple[str, str], ...] = (
+    ('various projects', 'Be specific about which projects'),
+    ('multiple times', 'Specify how many times or give examples'),
+    ('several initiatives', 'Name the initiatives'),
+    ('numerous improvements', 'Quantify the improvements'),
+    ('enhanced quality', 'Specify how quality was enhanced'),
+    ('improved performance', 'Use specific metrics'),
+    ('increased efficiency', 'Quantify the efficiency gain'),
+    ('better experience', 'Describe what improved'),
+)
+
+# Warning text per phrase, formatted once at import. Substring checks on the
+# lowercased response measured well ahead of a fused re.IGNORECASE alternation.
+_GENERIC_WARNINGS: Tuple[Tuple[str, str], ...] = tuple(
+    (phrase, f"Generic phrase detected: '{phrase}'. {suggestion}.")
+    for phrase, suggestion in _GENERIC_PHRASES
+)
+
+# Sentence boundary: terminal punctuation followed by whitespace, so decimals
+# such as "99.4%" do not split a sentence
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+
+_DIGIT_RE = re.compile(r'\d')
+
+_PASSIVE_INDICATORS = ('was implemented', 'were created', 'was developed', 'were completed')
+
+_STATUS_EMOJI = {
+    'EXCELLENT': '✅',
+    'GOOD': '✓',
+    'NEEDS_WORK': '⚠️',
+    'POOR': '❌',
+    'ERROR': '🚫'
+}
+
 
 class ReviewValidator:
     """Comprehensive validator for performance review responses."""
@@ -19,6 +68,26 @@ class ReviewValidator:
         self.technologies = data.get('technologies', [])
         self.role = data['metadata']['role']
         self.team = data['metadata']['team']
+        
+        # Per-review constants for the role/team and opening checks
+        self._role_known = self.role != 'UNKNOWN'
+        self._role = sys.intern(self.role)
+        self._team = sys.intern(self.team)
+        # The expected opening names only what is known; an empty team must not
+        # leave "in the  Team" in it
+        if self._role_known and self._team:
+            self._expected_openings = (
+                f"As an {self._role} in the {self._team} Team",
+                f"As a {self._role} in the {self._team} Team",
+            )
+        elif self._role_known:
+            self._expected_openings = (f"As an {self._role}", f"As a {self._role}")
+        else:
+            self._expected_openings = ("As an", "As a")
+        
+        # Weighted by how often each term is listed, matching a per-item count
+        self._metric_counts = Counter(self.metrics_texts)
+        self._tech_counts = Counter(self.technologies)
     
     def validate_section(self, section_name: str, response: str) -> Tuple[List[str], List[str], int]:
         """
@@ -28,9 +97,16 @@ class ReviewValidator:
         errors = []
         warnings = []
         quality_score = 100
+        response_lower = response.lower()
         
-        # Check 1: Length validation
+        # Word count for check 1; per-sentence words shared by checks 7 and 8
         word_count = len(response.split())
+        sentence_words = [
+            words for words in (sentence.split() for sentence in _SENTENCE_END_RE.split(response))
+            if words
+        ]
+        
+        # Check 1: Length validation
         if word_count < 40:
             errors.append(f"Response too short ({word_count} words). Need at least 60 words.")
             quality_score -= 20
@@ -42,30 +118,22 @@ class ReviewValidator:
             quality_score -= 5
         
         # Check 2: Role and team mention
-        if self.role != 'UNKNOWN' and self.role not in response:
+        if self._role_known and self._role not in response:
             errors.append(f"Response must mention role: '{self.role}'")
             quality_score -= 15
         
-        if self.team and self.team not in response:
+        if self._team and self._team not in response:
             errors.append(f"Response must mention team: '{self.team}'")
             quality_score -= 15
         
         # Check 3: Opening phrase validation
-        expected_opening = f"As an {self.role} in the {self.team} Team"
-        if not response.startswith("As an") and not response.startswith("As a"):
+        if not response.startswith(self._expected_openings):
             warnings.append("Response should start with 'As an [ROLE] in the [TEAM] Team...'")
             quality_score -= 10
         
         # Check 4: Metrics validation (for metric-heavy sections)
-        metric_sections = [
-            'Engineering/Operation Excellence',
-            'Tech Initiatives',
-            'Impact',
-            'Ambiguity & Problem Complexity'
-        ]
-        
-        if section_name in metric_sections and self.metrics_texts:
-            metrics_found = sum(1 for m in self.metrics_texts if m in response)
+        if section_name in _METRIC_SECTIONS and self.metrics_texts:
+            metrics_found = sum(count for term, count in self._metric_counts.items() if term in response)
             if metrics_found == 0:
                 warnings.append("No metrics found. Include specific numbers to strengthen the response.")
                 quality_score -= 10
@@ -74,54 +142,39 @@ class ReviewValidator:
                 quality_score -= 5
         
         # Check 5: Generic phrases detection
-        generic_phrases = {
-            'various projects': 'Be specific about which projects',
-            'multiple times': 'Specify how many times or give examples',
-            'several initiatives': 'Name the initiatives',
-            'numerous improvements': 'Quantify the improvements',
-            'enhanced quality': 'Specify how quality was enhanced',
-            'improved performance': 'Use specific metrics',
-            'increased efficiency': 'Quantify the efficiency gain',
-            'better experience': 'Describe what improved',
-        }
-        
-        for phrase, suggestion in generic_phrases.items():
-            if phrase.lower() in response.lower():
-                warnings.append(f"Generic phrase detected: '{phrase}'. {suggestion}.")
-                quality_score -= 3
+        generic_warnings = [warning for phrase, warning in _GENERIC_WARNINGS if phrase in response_lower]
+        warnings.extend(generic_warnings)
+        quality_score -= 3 * len(generic_warnings)
         
         # Check 6: Technology mentions (for tech sections)
-        tech_sections = ['Tech Initiatives', 'Engineering/Operation Excellence', 'Roadmap Delivery']
-        if section_name in tech_sections and self.technologies:
-            techs_found = sum(1 for t in self.technologies if t in response)
+        if section_name in _TECH_SECTIONS and self.technologies:
+            techs_found = sum(count for term, count in self._tech_counts.items() if term in response)
             if techs_found == 0:
                 warnings.append("No specific technologies mentioned. Reference actual tools/frameworks used.")
                 quality_score -= 8
         
         # Check 7: Sentence structure variety
-        sentences = response.split('. ')
-        if len(sentences) >= 3:
-            sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
-            if len(set(sentence_lengths)) < 2:
+        if len(sentence_words) >= 3:
+            sentence_lengths = {len(words) for words in sentence_words}
+            if len(sentence_lengths) < 2:
                 warnings.append("Vary sentence lengths for better readability.")
                 quality_score -= 3
         
         # Check 8: Avoid repetitive starts
-        sentence_starts = [s.strip().split()[0] for s in sentences if s.strip() and len(s.strip().split()) > 0]
+        sentence_starts = [words[0] for words in sentence_words]
         if len(sentence_starts) > 2:
             if len(sentence_starts) != len(set(sentence_starts)):
                 warnings.append("Avoid starting multiple sentences with the same word.")
                 quality_score -= 5
         
         # Check 9: Data-driven language
-        has_data = any(char.isdigit() for char in response)
-        if not has_data and section_name in metric_sections:
+        has_data = _DIGIT_RE.search(response) is not None
+        if not has_data and section_name in _METRIC_SECTIONS:
             warnings.append("Include specific numbers or metrics to demonstrate impact.")
             quality_score -= 10
         
         # Check 10: Active voice check
-        passive_indicators = ['was implemented', 'were created', 'was developed', 'were completed']
-        passive_count = sum(1 for ind in passive_indicators if ind.lower() in response.lower())
+        passive_count = sum(1 for ind in _PASSIVE_INDICATORS if ind in response_lower)
         if passive_count > 2:
             warnings.append("Use active voice for stronger impact (e.g., 'I implemented' vs 'was implemented').")
             quality_score -= 5
@@ -178,63 +231,60 @@ class ReviewValidator:
     
     def print_validation_report(self, results: Dict[str, Any]):
         """Print a detailed validation report."""
-        print("\n" + "=" * 70)
-        print("📊 PERFORMANCE REVIEW VALIDATION REPORT")
-        print("=" * 70)
+        sys.stdout.write(self._format_validation_report(results))
+    
+    def _format_validation_report(self, results: Dict[str, Any]) -> str:
+        """Render the validation report as a single string."""
+        lines = []
+        lines.append("\n" + "=" * 70)
+        lines.append("📊 PERFORMANCE REVIEW VALIDATION REPORT")
+        lines.append("=" * 70)
         
         summary = results['summary']
-        print(f"\n🎯 Overall Status: {summary['overall_status']}")
-        print(f"📈 Average Quality Score: {summary['average_score']}/100")
-        print(f"❌ Total Errors: {summary['total_errors']}")
-        print(f"⚠️  Total Warnings: {summary['total_warnings']}")
-        print(f"📄 Sections Validated: {summary['sections_validated']}")
+        lines.append(f"\n🎯 Overall Status: {summary['overall_status']}")
+        lines.append(f"📈 Average Quality Score: {summary['average_score']}/100")
+        lines.append(f"❌ Total Errors: {summary['total_errors']}")
+        lines.append(f"⚠️  Total Warnings: {summary['total_warnings']}")
+        lines.append(f"📄 Sections Validated: {summary['sections_validated']}")
         
-        print("\n" + "=" * 70)
-        print("SECTION-BY-SECTION ANALYSIS")
-        print("=" * 70)
+        lines.append("\n" + "=" * 70)
+        lines.append("SECTION-BY-SECTION ANALYSIS")
+        lines.append("=" * 70)
         
         for section_name, section_results in results['sections'].items():
-            status_emoji = {
-                'EXCELLENT': '✅',
-                'GOOD': '✓',
-                'NEEDS_WORK': '⚠️',
-                'POOR': '❌',
-                'ERROR': '🚫'
-            }
-            
-            emoji = status_emoji.get(section_results['status'], '❓')
-            print(f"\n{emoji} {section_name}")
-            print(f"   Score: {section_results['score']}/100 | Status: {section_results['status']}")
+            emoji = _STATUS_EMOJI.get(section_results['status'], '❓')
+            lines.append(f"\n{emoji} {section_name}")
+            lines.append(f"   Score: {section_results['score']}/100 | Status: {section_results['status']}")
             
             if 'word_count' in section_results:
-                print(f"   Words: {section_results['word_count']}")
+                lines.append(f"   Words: {section_results['word_count']}")
             
             if section_results['errors']:
-                print(f"   ❌ Errors:")
-                for error in section_results['errors']:
-                    print(f"      • {error}")
+                lines.append("   ❌ Errors:")
+                lines.extend(f"      • {error}" for error in section_results['errors'])
             
             if section_results['warnings']:
-                print(f"   ⚠️  Warnings:")
-                for warning in section_results['warnings']:
-                    print(f"      • {warning}")
+                lines.append("   ⚠️  Warnings:")
+                lines.extend(f"      • {warning}" for warning in section_results['warnings'])
         
-        print("\n" + "=" * 70)
+        lines.append("\n" + "=" * 70)
         
         # Recommendations
         if summary['overall_status'] == 'NEEDS_IMPROVEMENT':
-            print("\n💡 RECOMMENDATIONS:")
-            print("   • Focus on sections with scores below 75")
-            print("   • Add specific metrics and examples")
-            print("   • Ensure all sections mention role and team")
-            print("   • Use active voice and varied sentence structures")
+            lines.append("\n💡 RECOMMENDATIONS:")
+            lines.append("   • Focus on sections with scores below 75")
+            lines.append("   • Add specific metrics and examples")
+            lines.append("   • Ensure all sections mention role and team")
+            lines.append("   • Use active voice and varied sentence structures")
         elif summary['overall_status'] == 'GOOD':
-            print("\n💡 RECOMMENDATIONS:")
-            print("   • Address any remaining warnings")
-            print("   • Enhance sections with generic language")
-            print("   • Add more specific metrics where possible")
+            lines.append("\n💡 RECOMMENDATIONS:")
+            lines.append("   • Address any remaining warnings")
+            lines.append("   • Enhance sections with generic language")
+            lines.append("   • Add more specific metrics where possible")
         else:
-            print("\n🎉 Excellent work! Your review is comprehensive and data-driven.")
+            lines.append("\n🎉 Excellent work! Your review is comprehensive and data-driven.")
+        
+        return '\n'.join(lines) + '\n'
 
 
 def main():
@@ -250,11 +300,8 @@ def main():
     
     try:
         # Load data
-        with open(args.data_json, 'r') as f:
-            data = json.load(f)
-        
-        with open(args.responses_json, 'r') as f:
-            responses = json.load(f)
+        data = load_json(args.data_json)
+        responses = load_json(args.responses_json)
         
         # Validate
         validator = ReviewValidator(data)
@@ -265,8 +312,7 @@ def main():
         
         # Save if requested
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
+            dump_json(results, args.output)
             print(f"\n💾 Saved validation report to: {args.output}")
         
     except FileNotFoundError as e: